@@ -43,3 +43,8 @@ def _open_zarr_store(path: UPath, **kwargs: Any) -> zarr.storage.BaseStore:
     The zarr.storage.BaseStorage object.
     """
     return FSStore(url=path.path, fs=path.fs, **kwargs)
+
+
+def _is_remote_path(path: UPath) -> bool:
+    """Whether a path points to a remote (latency-bound) storage, as opposed to the local file system."""
+    return path.protocol not in ("", "file", "local")
@@ -56,7 +56,9 @@ def _get_element_annotators(sdata: SpatialData, element_name: str) -> set[str]:
     return table_names
 
 
-def _filter_table_by_element_names(table: AnnData | None, element_names: str | list[str]) -> AnnData | None:
+def _filter_table_by_element_names(
+    table: AnnData | None, element_names: list[str] | set[str] | frozenset[str]
+) -> AnnData | None:
     """
     Filter an AnnData table to keep only the rows that are in the coordinate system.
 
@@ -1,31 +1,29 @@
 from __future__ import annotations
 
-import hashlib
-import os
+import logging
 import warnings
-from collections.abc import Generator
-from itertools import chain
+from collections.abc import Callable, Generator, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
-import pandas as pd
+import numpy as np
 import zarr
 from anndata import AnnData
-from dask.dataframe import read_parquet
 from dask.dataframe.core import DataFrame as DaskDataFrame
 from dask.delayed import Delayed
 from geopandas import GeoDataFrame
 from multiscale_spatial_image.multiscale_spatial_image import MultiscaleSpatialImage
-from ome_zarr.types import JSONDict
-from shapely import MultiPolygon, Polygon
+from pandas import CategoricalDtype
 from spatial_image import SpatialImage
 from upath import UPath
 
-from spatialdata._core._elements import Images, Labels, Points, Shapes, Tables
-from spatialdata._core._utils import _open_zarr_store
+from spatialdata._core._elements import Elements, Images, Labels, Points, Shapes, Tables
+from spatialdata._core._utils import _is_remote_path, _open_zarr_store
 from spatialdata._logging import logger
 from spatialdata._types import ArrayLike, Raster_T
-from spatialdata._utils import _error_message_add_element, deprecation_alias
+from spatialdata._utils import _error_message_add_element, _natural_keys, deprecation_alias
 from spatialdata.models import (
     Image2DModel,
     Image3DModel,
@@ -39,8 +37,19 @@ from spatialdata.models import (
     get_table_keys,
 )
 from spatialdata.models._utils import SpatialElement, get_axes_names
+from spatialdata.transformations.operations import (
+    get_transformation,
+    get_transformation_between_coordinate_systems,
+    remove_transformation,
+    set_transformation,
+)
+from spatialdata.transformations.transformations import BaseTransformation, Sequence
 
 if TYPE_CHECKING:
+    import pandas as pd
+    from ome_zarr.types import JSONDict
+    from shapely import MultiPolygon, Polygon
+
     from spatialdata._core.query.spatial_query import BaseSpatialRequest
 
 # schema for elements
@@ -52,6 +61,85 @@ Shape_s = ShapesModel()
 Point_s = PointsModel()
 Table_s = TableModel()
 
+# element type under which the elements of each model are stored
+_SCHEMA_TO_ELEMENT_TYPE: dict[type, str] = {
+    Image2DModel: "images",
+    Image3DModel: "images",
+    Labels2DModel: "labels",
+    Labels3DModel: "labels",
+    PointsModel: "points",
+    ShapesModel: "shapes",
+    TableModel: "tables",
+}
+
+# element types that can be stored as groups in the Zarr store
+_VALID_ELEMENT_TYPES: frozenset[str] = frozenset({"images", "labels", "points", "polygons", "shapes", "tables"})
+
+# transformations of elements to a target coordinate system, keyed by (exact element's transformations, target)
+_TransformationsCache = dict[tuple[frozenset[tuple[str, Hashable]], str], BaseTransformation]
+
+
+def _exact_transformation_key(transformation: BaseTransformation) -> Hashable:
+    """
+    Get a hashable key identifying a transformation by the exact values of its parameters.
+
+    `BaseTransformation.__eq__` compares the parameters with `np.allclose`, so it cannot tell apart transformations
+    that differ by less than its tolerance (e.g. translations by 100000 and 100001).
+    """
+
+    def _key(value: Any) -> Hashable:
+        if isinstance(value, BaseTransformation):
+            return type(value).__name__, tuple((k, _key(v)) for k, v in sorted(vars(value).items()))
+        if isinstance(value, np.ndarray):
+            return value.shape, value.dtype.str, value.tobytes()
+        if isinstance(value, dict):
+            return tuple((k, _key(v)) for k, v in sorted(value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(_key(v) for v in value)
+        return value
+
+    return _key(transformation)
+
+
+@cache
+def _get_element_writers() -> dict[str, Callable[[Any, zarr.Group, zarr.Group, str], None]]:
+    """
+    Get the functions writing each element type, taking the element, the root group, the element type group and name.
+
+    The writers are imported lazily to avoid a circular import with the IO module.
+    """
+    from spatialdata._io import write_image, write_labels, write_points, write_shapes, write_table
+
+    return {
+        "images": lambda element, _, group, name: write_image(image=element, group=group, name=name),
+        # labels are written from the root group, so that ome-zarr can also update the metadata of the labels group
+        "labels": lambda element, root, _, name: write_labels(labels=element, group=root, name=name),
+        "points": lambda element, _, group, name: write_points(points=element, group=group, name=name),
+        "shapes": lambda element, _, group, name: write_shapes(shapes=element, group=group, name=name),
+        "tables": lambda element, _, group, name: write_table(table=element, group=group, name=name),
+    }
+
+
+@cache
+def _get_transformations_writers() -> dict[str, Callable[..., None]]:
+    """
+    Get the functions overwriting the coordinate transformations saved on disk for each element type.
+
+    The writers are imported lazily to avoid a circular import with the IO module.
+    """
+    from spatialdata._io._utils import (
+        overwrite_coordinate_transformations_non_raster,
+        overwrite_coordinate_transformations_raster,
+    )
+
+    return {
+        "images": overwrite_coordinate_transformations_raster,
+        "labels": overwrite_coordinate_transformations_raster,
+        "points": overwrite_coordinate_transformations_non_raster,
+        "shapes": overwrite_coordinate_transformations_non_raster,
+        "tables": overwrite_coordinate_transformations_non_raster,
+    }
+
 
 class SpatialData:
     """
@@ -119,6 +207,9 @@ class SpatialData:
         tables: dict[str, AnnData] | Tables | None = None,
     ) -> None:
         self._path: UPath | None = None
+        self._zarr_root_cache: dict[tuple[UPath, str], zarr.Group] = {}
+        # result of has_consolidated_metadata() for the current path, None if the store has not been probed yet
+        self._has_consolidated_metadata: bool | None = None
 
         self._shared_keys: set[str | None] = set()
         self._images: Images = Images(shared_keys=self._shared_keys)
@@ -131,29 +222,31 @@ class SpatialData:
         if isinstance(tables, AnnData):
             tables = {"table": tables}
 
-        element_names = list(chain.from_iterable([e.keys() for e in [images, labels, points, shapes] if e is not None]))
+        seen: set[str] = set()
+        duplicates: set[str] = set()
+        for d in (images, labels, points, shapes):
+            if d is None:
+                continue
+            for k in d:
+                if k in seen:
+                    duplicates.add(k)
+                else:
+                    seen.add(k)
 
-        if len(element_names) != len(set(element_names)):
-            duplicates = {x for x in element_names if element_names.count(x) > 1}
+        if duplicates:
             raise KeyError(
                 f"Element names must be unique. The following element names are used multiple times: {duplicates}"
             )
 
-        if images is not None:
-            for k, v in images.items():
-                self.images[k] = v
-
-        if labels is not None:
-            for k, v in labels.items():
-                self.labels[k] = v
-
-        if shapes is not None:
-            for k, v in shapes.items():
-                self.shapes[k] = v
-
-        if points is not None:
-            for k, v in points.items():
-                self.points[k] = v
+        # update() goes through __setitem__ of the element containers, so each element is still validated
+        for src, tgt in (
+            (images, self._images),
+            (labels, self._labels),
+            (shapes, self._shapes),
+            (points, self._points),
+        ):
+            if src:
+                tgt.update(src)
 
         if tables is not None:
             for k, v in tables.items():
@@ -182,12 +275,18 @@ class SpatialData:
         UserWarning
             The dtypes of the instance key column in the table and the annotation target do not match.
         """
-        TableModel().validate(table)
+        Table_s.validate(table)
         if TableModel.ATTRS_KEY in table.uns:
             region, _, instance_key = get_table_keys(table)
             region = region if isinstance(region, list) else [region]
+            table_dtype = table.obs[instance_key].dtype
+            table_dtype_is_str = table_dtype == str
+            # element names are unique across element types, so the spatial elements can be merged in a single dict
+            local_lookup: dict[str, SpatialElement] = {}
+            for d in (self._images, self._labels, self._shapes, self._points):
+                local_lookup.update(d)
             for r in region:
-                element = self.get(r)
+                element = local_lookup.get(r)
                 if element is None:
                     warnings.warn(
                         f"The table is annotating {r!r}, which is not present in the SpatialData object.",
@@ -201,12 +300,10 @@ class SpatialData:
                         dtype = element.scale0.ds.dtypes["image"]
                     else:
                         dtype = element.index.dtype
-                    if dtype != table.obs[instance_key].dtype and (
-                        dtype == str or table.obs[instance_key].dtype == str
-                    ):
+                    if dtype != table_dtype and (dtype == str or table_dtype_is_str):
                         raise TypeError(
                             f"Table instance_key column ({instance_key}) has a dtype "
-                            f"({table.obs[instance_key].dtype}) that does not match the dtype of the indices of "
+                            f"({table_dtype}) that does not match the dtype of the indices of "
                             f"the annotated element ({dtype})."
                         )
 
@@ -234,23 +331,10 @@ class SpatialData:
         }
         for k, e in elements_dict.items():
             schema = get_model(e)
-            if schema in (Image2DModel, Image3DModel):
-                assert isinstance(d["images"], dict)
-                d["images"][k] = e
-            elif schema in (Labels2DModel, Labels3DModel):
-                assert isinstance(d["labels"], dict)
-                d["labels"][k] = e
-            elif schema == PointsModel:
-                assert isinstance(d["points"], dict)
-                d["points"][k] = e
-            elif schema == ShapesModel:
-                assert isinstance(d["shapes"], dict)
-                d["shapes"][k] = e
-            elif schema == TableModel:
-                assert isinstance(d["tables"], dict)
-                d["tables"][k] = e
-            else:
+            element_type = _SCHEMA_TO_ELEMENT_TYPE.get(schema)
+            if element_type is None:
                 raise ValueError(f"Unknown schema {schema}")
+            d[element_type][k] = e  # type: ignore[index]
         return SpatialData(**d)  # type: ignore[arg-type]
 
     @staticmethod
@@ -281,16 +365,27 @@ class SpatialData:
 
         Returns
         -------
-        The region key column.
+        The region key column. The column is returned with categorical dtype (as set by `TableModel.parse`); if it has
+        been replaced in table.obs by a non-categorical column, a categorical copy of it is returned.
 
         Raises
         ------
         KeyError
             If the region key column is not found in table.obs.
+
+        Notes
+        -----
+        Previously, the column was returned with the dtype that it has in table.obs. A region key column with a
+        non-categorical (e.g. object) dtype is now converted to categorical; use `.astype(str)` to get the previous
+        values back, and modify the column through table.obs rather than through the returned copy.
         """
         _, region_key, _ = get_table_keys(table)
-        if table.obs.get(region_key) is not None:
-            return table.obs[region_key]
+        if region_key in table.obs.columns:
+            region_column = table.obs[region_key]
+            if not isinstance(region_column.dtype, CategoricalDtype):
+                # the few regions annotated by a table make unique() and value_counts() much cheaper on categoricals
+                region_column = region_column.astype("category")
+            return region_column
         raise KeyError(f"{region_key} is set as region key column. However the column is not found in table.obs.")
 
     @staticmethod
@@ -314,7 +409,7 @@ class SpatialData:
 
         """
         _, _, instance_key = get_table_keys(table)
-        if table.obs.get(instance_key) is not None:
+        if instance_key in table.obs.columns:
             return table.obs[instance_key]
         raise KeyError(f"{instance_key} is set as instance key column. However the column is not found in table.obs.")
 
@@ -350,8 +445,8 @@ class SpatialData:
         ValueError
             If `instance_key` is not present in the `table.obs` columns.
         """
-        TableModel()._validate_set_region_key(table, region_key)
-        TableModel()._validate_set_instance_key(table, instance_key)
+        Table_s._validate_set_region_key(table, region_key)
+        Table_s._validate_set_instance_key(table, instance_key)
         attrs = {
             TableModel.REGION_KEY: region,
             TableModel.REGION_KEY_KEY: region_key,
@@ -393,10 +488,18 @@ class SpatialData:
         """
         attrs = table.uns[TableModel.ATTRS_KEY]
         table_region_key = region_key if region_key else attrs.get(TableModel.REGION_KEY_KEY)
+        # the symmetry between the region and the region key column has already been checked when the current
+        # annotation metadata was set, no need to scan the region key column again if neither of them changed
+        region_unchanged = (
+            isinstance(region, (str, list))
+            and attrs.get(TableModel.REGION_KEY) == region
+            and table_region_key == attrs.get(TableModel.REGION_KEY_KEY)
+        )
 
-        TableModel()._validate_set_region_key(table, region_key)
-        TableModel()._validate_set_instance_key(table, instance_key)
-        check_target_region_column_symmetry(table, table_region_key, region)
+        Table_s._validate_set_region_key(table, region_key)
+        Table_s._validate_set_instance_key(table, instance_key)
+        if not region_unchanged:
+            check_target_region_column_symmetry(table, table_region_key, region)
         attrs[TableModel.REGION_KEY] = region
 
     @staticmethod
@@ -461,9 +564,11 @@ class SpatialData:
             If no current annotation metadata is found and both region_key and instance_key are not specified.
         """
         table = self.tables[table_name]
-        element_names = {element[1] for element in self._gen_elements()}
-        if region not in element_names:
-            raise ValueError(f"Annotation target '{region}' not present as SpatialElement in SpatialData object.")
+        # a list or a pd.Series of regions is not hashable, so its (unique) values are looked up one by one
+        regions = [region] if isinstance(region, str) else list(dict.fromkeys(region))
+        for r in regions:
+            if not any(r in d for d in (self._images, self._labels, self._points, self._shapes)):
+                raise ValueError(f"Annotation target '{r}' not present as SpatialElement in SpatialData object.")
 
         if table.uns.get(TableModel.ATTRS_KEY):
             self._change_table_annotation_target(table, region, region_key, instance_key)
@@ -537,22 +642,54 @@ class SpatialData:
 
     @path.setter
     def path(self, value: str | Path | UPath | None) -> None:
-        if value is None:
-            self._path = None
-        if isinstance(value, (str, Path)):
-            self._path = UPath(value)
-        elif isinstance(value, UPath):
+        # the path is normalized to a UPath (or None) once here, so that the getter is a plain attribute access
+        if value is None or isinstance(value, UPath):
             self._path = value
+        elif isinstance(value, (str, Path)):
+            self._path = UPath(value)
         else:
             raise TypeError("Path must be `None`, a `str`, `Path` or `UPath` object.")
+        self._zarr_root_cache.clear()
+        self._has_consolidated_metadata = None
 
-        if not self.is_self_contained():
+        # checking if the object is self-contained traverses the Dask graphs of all the elements, only do it if the
+        # message would be logged
+        if logger.isEnabledFor(logging.INFO) and not self.is_self_contained():
             logger.info(
                 "The SpatialData object is not self-contained (i.e. it contains some elements that are Dask-backed from"
                 f" locations outside {self.path}). Please see the documentation of `is_self_contained()` to understand"
                 f" the implications of working with SpatialData objects that are not self-contained."
             )
 
+    def _get_zarr_root(self, zarr_path: UPath, mode: str) -> zarr.Group:
+        """
+        Get the root Zarr group of a store, reusing the group opened by a previous call with the same path and mode.
+
+        The stores are not closed after each use but kept open together with the cached groups. A read-only request
+        reuses a group already opened in `"r+"` mode for the same path, so that probing for an element and then
+        writing it only opens one store.
+
+        Parameters
+        ----------
+        zarr_path
+            The path to the Zarr storage.
+        mode
+            The mode used to open the store.
+
+        Returns
+        -------
+        The root Zarr group.
+        """
+        key = (zarr_path, mode)
+        root = self._zarr_root_cache.get(key)
+        if root is None and mode == "r":
+            root = self._zarr_root_cache.get((zarr_path, "r+"))
+        if root is None:
+            store = _open_zarr_store(zarr_path, mode=mode)
+            root = zarr.group(store=store)
+            self._zarr_root_cache[key] = root
+        return root
+
     def _get_groups_for_element(
         self, zarr_path: str | Path | UPath, element_type: str, element_name: str
     ) -> tuple[zarr.Group, zarr.Group, zarr.Group]:
@@ -576,10 +713,9 @@ class SpatialData:
         """
         if not isinstance(zarr_path, UPath):
             zarr_path = UPath(zarr_path)
-        store = _open_zarr_store(zarr_path, mode="r+")
-        root = zarr.group(store=store)
-        if element_type not in ["images", "labels", "points", "polygons", "shapes", "tables"]:
+        if element_type not in _VALID_ELEMENT_TYPES:
             raise ValueError(f"Unknown element type {element_type}")
+        root = self._get_zarr_root(zarr_path, mode="r+")
         element_type_group = root.require_group(element_type)
         element_name_group = element_type_group.require_group(element_name)
         return root, element_type_group, element_name_group
@@ -599,12 +735,9 @@ class SpatialData:
         -------
         True if the group exists, False otherwise.
         """
-        store = _open_zarr_store(zarr_path, mode="r")
-        root = zarr.group(store=store)
-        assert element_type in ["images", "labels", "points", "polygons", "shapes", "tables"]
-        exists = element_type in root and element_name in root[element_type]
-        store.close()
-        return exists
+        assert element_type in _VALID_ELEMENT_TYPES
+        root = self._get_zarr_root(zarr_path, mode="r")
+        return element_type in root and element_name in root[element_type]
 
     def locate_element(self, element: SpatialElement) -> list[str]:
         """
@@ -620,20 +753,29 @@ class SpatialData:
         A list of Zarr paths of the element relative to the root (multiple copies of the same element are allowed).
         The list is empty if the element is not present.
         """
-        found: list[SpatialElement] = []
-        found_element_type: list[str] = []
-        found_element_name: list[str] = []
-        for element_type in ["images", "labels", "points", "shapes", "tables"]:
-            for element_name, element_value in getattr(self, element_type).items():
-                if id(element_value) == id(element):
-                    found.append(element_value)
-                    found_element_type.append(element_type)
-                    found_element_name.append(element_name)
-        if len(found) == 0:
-            return []
-        if any("/" in found_element_name[i] or "/" in found_element_type[i] for i in range(len(found))):
-            raise ValueError("Found an element name with a '/' character. This is not allowed.")
-        return [f"{found_element_type[i]}/{found_element_name[i]}" for i in range(len(found))]
+        return [f"{element_type}/{element_name}" for element_type, element_name in self._locate_element(element)]
+
+    def _locate_element(self, element: SpatialElement) -> list[tuple[str, str]]:
+        """Like `locate_element`, but returns the (element type, element name) pairs instead of the Zarr paths."""
+        # only scan the element types that can contain an object of the type of the queried element
+        containers: tuple[tuple[str, Elements], ...]
+        if isinstance(element, (SpatialImage, MultiscaleSpatialImage)):
+            containers = (("images", self._images), ("labels", self._labels))
+        elif isinstance(element, DaskDataFrame):
+            containers = (("points", self._points),)
+        elif isinstance(element, GeoDataFrame):
+            containers = (("shapes", self._shapes),)
+        elif isinstance(element, AnnData):
+            containers = (("tables", self._tables),)
+        else:
+            containers = self._element_containers()
+
+        return [
+            (element_type, element_name)
+            for element_type, container in containers
+            for element_name, element_value in container.items()
+            if element_value is element
+        ]
 
     @deprecation_alias(filter_table="filter_tables")
     def filter_by_coordinate_system(
@@ -662,22 +804,15 @@ class SpatialData:
         """
         # TODO: decide whether to add parameter to filter only specific table.
 
-        from spatialdata.transformations.operations import get_transformation
-
         elements: dict[str, dict[str, SpatialElement]] = {}
         element_names_in_coordinate_system = []
-        if isinstance(coordinate_system, str):
-            coordinate_system = [coordinate_system]
+        cs_set = frozenset([coordinate_system] if isinstance(coordinate_system, str) else coordinate_system)
         for element_type, element_name, element in self._gen_elements():
             if element_type != "tables":
                 transformations = get_transformation(element, get_all=True)
-                assert isinstance(transformations, dict)
-                for cs in coordinate_system:
-                    if cs in transformations:
-                        if element_type not in elements:
-                            elements[element_type] = {}
-                        elements[element_type][element_name] = element
-                        element_names_in_coordinate_system.append(element_name)
+                if not cs_set.isdisjoint(transformations):
+                    elements.setdefault(element_type, {})[element_name] = element
+                    element_names_in_coordinate_system.append(element_name)
         tables = self._filter_tables(
             set(), filter_tables, "cs", include_orphan_tables, element_names=element_names_in_coordinate_system
         )
@@ -720,9 +855,20 @@ class SpatialData:
 
         """
         if filter_tables:
+            from spatialdata._core.query.relational_query import (
+                _filter_table_by_element_names,
+                _filter_table_by_elements,
+            )
+
+            attrs_key = TableModel.ATTRS_KEY
+            element_names_set = (
+                None
+                if element_names is None
+                else frozenset([element_names] if isinstance(element_names, str) else element_names)
+            )
             tables: dict[str, AnnData] | Tables = {}
             for table_name, table in self._tables.items():
-                if include_orphan_tables and not table.uns.get(TableModel.ATTRS_KEY):
+                if include_orphan_tables and not table.uns.get(attrs_key):
                     tables[table_name] = table
                     continue
                 if table_name in names_tables_to_keep:
@@ -730,15 +876,11 @@ class SpatialData:
                     continue
                 # each mode here requires paths or elements, using assert here to avoid mypy errors.
                 if by == "cs":
-                    from spatialdata._core.query.relational_query import _filter_table_by_element_names
-
-                    assert element_names is not None
-                    table = _filter_table_by_element_names(table, element_names)
+                    assert element_names_set is not None
+                    table = _filter_table_by_element_names(table, element_names_set)
                     if len(table) != 0:
                         tables[table_name] = table
                 elif by == "elements":
-                    from spatialdata._core.query.relational_query import _filter_table_by_elements
-
                     assert elements_dict is not None
                     table = _filter_table_by_elements(table, elements_dict=elements_dict)
                     if len(table) != 0:
@@ -762,8 +904,6 @@ class SpatialData:
         The method does not allow to rename a coordinate system into an existing one, unless the existing one is also
         renamed in the same call.
         """
-        from spatialdata.transformations.operations import get_transformation, set_transformation
-
         # check that the rename_dict is valid
         old_names = self.coordinate_systems
         new_names = list(set(old_names).difference(set(rename_dict.keys())))
@@ -781,25 +921,12 @@ class SpatialData:
         for element in self._gen_spatial_element_values():
             # get the transformations
             transformations = get_transformation(element, get_all=True)
-            assert isinstance(transformations, dict)
-
-            # appends a random suffix to the coordinate system name to avoid collisions
-            suffixes_to_replace = set()
-            for old_cs, new_cs in rename_dict.items():
-                if old_cs in transformations:
-                    random_suffix = hashlib.sha1(os.urandom(128)).hexdigest()[:8]
-                    transformations[new_cs + random_suffix] = transformations.pop(old_cs)
-                    suffixes_to_replace.add(new_cs + random_suffix)
-
-            # remove the random suffixes
-            new_transformations = {}
-            for cs_with_suffix in transformations:
-                if cs_with_suffix in suffixes_to_replace:
-                    cs = cs_with_suffix[:-8]
-                    new_transformations[cs] = transformations[cs_with_suffix]
-                    suffixes_to_replace.remove(cs_with_suffix)
-                else:
-                    new_transformations[cs_with_suffix] = transformations[cs_with_suffix]
+            if rename_dict.keys().isdisjoint(transformations):
+                continue
+
+            # the new dict is built from the old one, so no intermediate names are needed to avoid collisions (e.g. when
+            # swapping two coordinate systems); the validation above guarantees that the new names are unique
+            new_transformations = {rename_dict.get(cs, cs): t for cs, t in transformations.items()}
 
             # set the new transformations
             set_transformation(element=element, transformation=new_transformations, set_all=True)
@@ -825,35 +952,62 @@ class SpatialData:
         -------
         The transformed element.
         """
-        from spatialdata import transform
-        from spatialdata.transformations import Sequence
-        from spatialdata.transformations.operations import (
-            get_transformation,
-            get_transformation_between_coordinate_systems,
-            remove_transformation,
-            set_transformation,
+        return self._transform_element_to_coordinate_system(
+            element, target_coordinate_system, maintain_positioning=maintain_positioning
         )
 
-        t = get_transformation_between_coordinate_systems(self, element, target_coordinate_system)
+    def _transform_element_to_coordinate_system(
+        self,
+        element: SpatialElement,
+        target_coordinate_system: str,
+        maintain_positioning: bool = False,
+        transformations_cache: _TransformationsCache | None = None,
+    ) -> SpatialElement:
+        """
+        Transform an element to a given coordinate system, see `transform_element_to_coordinate_system()`.
+
+        Parameters
+        ----------
+        transformations_cache
+            Optional cache of the transformations between the intrinsic coordinate system of the elements and the
+            target coordinate systems, shared across calls that transform multiple elements of the same unmodified
+            SpatialData object. The transformation only depends on the outgoing edges of the element in the
+            transformations graph, so it is reused for the elements with exactly the same transformations (e.g.
+            elements read from disk, which do not share the transformation objects) to the same target coordinate
+            system.
+        """
+        # imported here to avoid a circular import (spatialdata._core.operations.transform imports SpatialData)
+        from spatialdata import transform
+
+        d_src = get_transformation(element, get_all=True)
+        if transformations_cache is None:
+            t = get_transformation_between_coordinate_systems(self, element, target_coordinate_system)
+        else:
+            key = (
+                frozenset((cs, _exact_transformation_key(tr)) for cs, tr in d_src.items()),
+                target_coordinate_system,
+            )
+            if key not in transformations_cache:
+                transformations_cache[key] = get_transformation_between_coordinate_systems(
+                    self, element, target_coordinate_system
+                )
+            t = transformations_cache[key]
         if maintain_positioning:
             transformed = transform(element, transformation=t, maintain_positioning=maintain_positioning)
         else:
-            d = get_transformation(element, get_all=True)
-            assert isinstance(d, dict)
             to_remove = False
-            if target_coordinate_system not in d:
-                d[target_coordinate_system] = t
+            if target_coordinate_system not in d_src:
+                d_src[target_coordinate_system] = t
                 to_remove = True
             transformed = transform(
                 element, to_coordinate_system=target_coordinate_system, maintain_positioning=maintain_positioning
             )
             if to_remove:
-                del d[target_coordinate_system]
+                del d_src[target_coordinate_system]
+        d_dst = get_transformation(transformed, get_all=True)
         if not maintain_positioning:
-            d = get_transformation(transformed, get_all=True)
-            assert isinstance(d, dict)
-            assert len(d) == 1
-            t = list(d.values())[0]
+            assert len(d_dst) == 1
+            t = next(iter(d_dst.values()))
             remove_transformation(transformed, remove_all=True)
             set_transformation(transformed, t, target_coordinate_system)
         else:
@@ -861,19 +1015,21 @@ class SpatialData:
             # (this may not be the case because it could be that the element is not directly mapped to that coordinate
             # system), then the transformation to the target coordinate system is not needed # because the data is now
             # already transformed; here we remove such transformation.
-            d = get_transformation(transformed, get_all=True)
-            assert isinstance(d, dict)
-            if target_coordinate_system in d:
+            if target_coordinate_system in d_dst:
                 # Because of how spatialdata._core.operations.transform._adjust_transformations() is implemented, we
                 # know that the transformation tt below is a sequence of transformations with two transformations,
                 # with the second transformation equal to t.transformations[0]. Let's remove the second transformation.
                 # since target_coordinate_system is in d, we have that t is a Sequence with only one transformation.
+                # (t may come from the cache of another element with exactly the same transformations, so it is
+                # identical to, but not necessarily the same object as, the transformation of this element)
                 assert isinstance(t, Sequence)
                 assert len(t.transformations) == 1
-                seq = get_transformation(transformed, to_coordinate_system=target_coordinate_system)
+                seq = d_dst[target_coordinate_system]
                 assert isinstance(seq, Sequence)
                 assert len(seq.transformations) == 2
-                assert seq.transformations[1] is t.transformations[0]
+                assert _exact_transformation_key(seq.transformations[1]) == _exact_transformation_key(
+                    t.transformations[0]
+                )
                 new_tt = seq.transformations[0]
                 set_transformation(transformed, new_tt, target_coordinate_system)
         return transformed
@@ -901,10 +1057,14 @@ class SpatialData:
         """
         sdata = self.filter_by_coordinate_system(target_coordinate_system, filter_tables=False)
         elements: dict[str, dict[str, SpatialElement]] = {}
+        transformations_cache: _TransformationsCache = {}
         for element_type, element_name, element in sdata.gen_elements():
             if element_type != "tables":
-                transformed = sdata.transform_element_to_coordinate_system(
-                    element, target_coordinate_system, maintain_positioning=maintain_positioning
+                transformed = sdata._transform_element_to_coordinate_system(
+                    element,
+                    target_coordinate_system,
+                    maintain_positioning=maintain_positioning,
+                    transformations_cache=transformations_cache,
                 )
                 if element_type not in elements:
                     elements[element_type] = {}
@@ -922,7 +1082,7 @@ class SpatialData:
         from spatialdata._io._utils import _is_element_self_contained
 
         if self.path is None:
-            return {element_name: True for _, element_name, _ in self.gen_elements()}
+            return {element_name: True for element_name in self._gen_element_names()}
 
         self._validate_element_names_are_unique()
         description = {}
@@ -965,15 +1125,22 @@ class SpatialData:
             2.  When calling `write_element()` and `write_element()` metadata, the changes will be applied to the Zarr
                 store associated with the SpatialData object, not on the external files.
         """
+        from spatialdata._io._utils import _is_element_self_contained
+
         if self.path is None:
             return True
 
-        description = self.elements_are_self_contained()
-
+        self._validate_element_names_are_unique()
+        path = self.path
         if element_name is not None:
-            return description[element_name]
+            element_type, _, element = self._find_element(element_name)
+            return _is_element_self_contained(element, path / element_type / element_name)
 
-        return all(description.values())
+        # stop at the first element that is not self-contained
+        return all(
+            _is_element_self_contained(element, path / element_type / name)
+            for element_type, name, element in self.gen_elements()
+        )
 
     def elements_paths_in_memory(self) -> list[str]:
         """
@@ -1108,18 +1275,43 @@ class SpatialData:
         self._validate_can_safely_write_to_path(file_path, overwrite=overwrite)
 
         store = _open_zarr_store(file_path, mode="w")
-        _ = zarr.group(store=store, overwrite=overwrite)
-        store.close()
-
-        for element_type, element_name, element in self.gen_elements():
-            self._write_element(
+        root = zarr.group(store=store, overwrite=overwrite)
+        # the store has been (re)created, previously opened root groups may be stale; the new root group is reused by
+        # _get_groups_for_element() to write all the elements
+        self._zarr_root_cache.clear()
+        self._zarr_root_cache[(file_path, "r+")] = root
+        self._has_consolidated_metadata = None
+
+        # the target path has been validated above and the store has just been (re)created, so the paths of the
+        # elements do not need to be validated again one by one
+        def _write(item: tuple[str, str, SpatialElement | AnnData]) -> None:
+            element_type, element_name, element = item
+            self._write_element_unchecked(
                 element=element,
                 zarr_container_path=file_path,
                 element_type=element_type,
                 element_name=element_name,
-                overwrite=False,
             )
 
+        # the elements are written to independent Zarr groups, so they can be written in parallel to hide the latency
+        # of remote stores (local writes are not latency-bound, and the threads would oversubscribe the threads of the
+        # dask scheduler computing the data). Labels are written sequentially since ome-zarr updates the list of
+        # labels in the attributes of the shared "labels" group.
+        items = list(self.gen_elements())
+        for element_type in {element_type for element_type, _, _ in items}:
+            root.require_group(element_type)
+        labels_items = [item for item in items if item[0] == "labels"]
+        other_items = [item for item in items if item[0] != "labels"]
+        if len(other_items) > 1 and _is_remote_path(file_path):
+            with ThreadPoolExecutor(max_workers=min(8, len(other_items))) as executor:
+                # consuming the iterator re-raises the first exception raised by a write
+                list(executor.map(_write, other_items))
+        else:
+            for item in other_items:
+                _write(item)
+        for item in labels_items:
+            _write(item)
+
         if self.path != file_path:
             old_path = self.path
             self.path = file_path
@@ -1144,24 +1336,32 @@ class SpatialData:
         self._validate_can_safely_write_to_path(
             file_path=file_path_of_element, overwrite=overwrite, saving_an_element=True
         )
+        self._write_element_unchecked(
+            element=element,
+            zarr_container_path=zarr_container_path,
+            element_type=element_type,
+            element_name=element_name,
+        )
 
+    def _write_element_unchecked(
+        self,
+        element: SpatialElement | AnnData,
+        zarr_container_path: UPath,
+        element_type: str,
+        element_name: str,
+    ) -> None:
+        """
+        Write an element without validating that it is safe to write to its path.
+
+        Only to be used when the validation has already been performed, e.g. by `write()` on a newly created store.
+        """
         root_group, element_type_group, _ = self._get_groups_for_element(
             zarr_path=zarr_container_path, element_type=element_type, element_name=element_name
         )
-        from spatialdata._io import write_image, write_labels, write_points, write_shapes, write_table
-
-        if element_type == "images":
-            write_image(image=element, group=element_type_group, name=element_name)
-        elif element_type == "labels":
-            write_labels(labels=element, group=root_group, name=element_name)
-        elif element_type == "points":
-            write_points(points=element, group=element_type_group, name=element_name)
-        elif element_type == "shapes":
-            write_shapes(shapes=element, group=element_type_group, name=element_name)
-        elif element_type == "tables":
-            write_table(table=element, group=element_type_group, name=element_name)
-        else:
+        writer = _get_element_writers().get(element_type)
+        if writer is None:
             raise ValueError(f"Unknown element type: {element_type}")
+        writer(element, root_group, element_type_group, element_name)
 
     def write_element(self, element_name: str | list[str], overwrite: bool = False) -> None:
         """
@@ -1184,11 +1384,16 @@ class SpatialData:
         if isinstance(element_name, list):
             for name in element_name:
                 assert isinstance(name, str)
-                self.write_element(name, overwrite=overwrite)
-            return
+                self._write_single_element(name, overwrite=overwrite)
+        else:
+            self._write_single_element(element_name, overwrite=overwrite)
 
-        from spatialdata._core._elements import Elements
+        # read_zarr() lists remote elements from the consolidated metadata, when present, so it must list the new
+        # elements; consolidating once for all the elements avoids rewriting the metadata for each of them
+        if self.has_consolidated_metadata():
+            self.write_consolidated_metadata()
 
+    def _write_single_element(self, element_name: str, overwrite: bool) -> None:
         Elements._check_valid_name(element_name)
         self._validate_element_names_are_unique()
         element = self.get(element_name)
@@ -1201,11 +1406,10 @@ class SpatialData:
                 "disk."
             )
 
-        element_type = None
-        for _element_type, _element_name, _ in self.gen_elements():
-            if _element_name == element_name:
-                element_type = _element_type
-                break
+        element_type = next(
+            (_element_type for _element_type, container in self._element_containers() if element_name in container),
+            None,
+        )
         if element_type is None:
             raise ValueError(f"Element with name {element_name} not found in SpatialData object.")
 
@@ -1258,7 +1462,6 @@ class SpatialData:
                 self.delete_element_from_disk(name)
             return
 
-        from spatialdata._core._elements import Elements
         from spatialdata._io._utils import _backed_elements_contained_in_path
 
         Elements._check_valid_name(element_name)
@@ -1310,9 +1513,12 @@ class SpatialData:
         if self.has_consolidated_metadata():
             self.write_consolidated_metadata()
 
-    def _check_element_not_on_disk_with_different_type(self, element_type: str, element_name: str) -> None:
-        only_on_disk = self.elements_paths_on_disk()
-        for disk_path in only_on_disk:
+    def _check_element_not_on_disk_with_different_type(
+        self, element_type: str, element_name: str, elements_paths_on_disk: list[str] | None = None
+    ) -> None:
+        if elements_paths_on_disk is None:
+            elements_paths_on_disk = self.elements_paths_on_disk()
+        for disk_path in elements_paths_on_disk:
             disk_element_type, disk_element_name = self._element_type_and_name_from_element_path(disk_path)
             if disk_element_name == element_name and disk_element_type != element_type:
                 raise ValueError(
@@ -1321,29 +1527,28 @@ class SpatialData:
                 )
 
     def write_consolidated_metadata(self) -> None:
-        store = _open_zarr_store(self.path, mode="r+")
+        assert self.path is not None
+        store = self._get_zarr_root(self.path, mode="r+").store
         # consolidate metadata to more easily support remote reading bug in zarr.
         # TODO: Because of bug https://github.com/zarr-developers/zarr-python/issues/1121
         # .zmetadata is not supported when using an FSStore.
         # Here we explicitly using zmetadata as the metadata key until this is fixed upstream.
         zarr.consolidate_metadata(store, metadata_key="zmetadata")
-        store.close()
+        self._has_consolidated_metadata = True
 
     def has_consolidated_metadata(self) -> bool:
-        return_value = False
-        store = _open_zarr_store(self.path, mode="r")
-        # TODO: Because of bug https://github.com/zarr-developers/zarr-python/issues/1121
-        # .zmetadata is not supported when using an FSStore.
-        # Here we explicitly using zmetadata as the metadata key until this is fixed upstream.
-        if "zmetadata" in store:
-            return_value = True
-        store.close()
-        return return_value
+        assert self.path is not None
+        # the probe is a round-trip for remote stores; the result is stored until the store is changed or rewritten
+        if self._has_consolidated_metadata is None:
+            store = self._get_zarr_root(self.path, mode="r").store
+            # TODO: Because of bug https://github.com/zarr-developers/zarr-python/issues/1121
+            # .zmetadata is not supported when using an FSStore.
+            # Here we explicitly using zmetadata as the metadata key until this is fixed upstream.
+            self._has_consolidated_metadata = "zmetadata" in store
+        return self._has_consolidated_metadata
 
     def _validate_can_write_metadata_on_element(self, element_name: str) -> tuple[str, SpatialElement | AnnData] | None:
         """Validate if metadata can be written on an element, returns None if it cannot be written."""
-        from spatialdata._io._utils import _is_element_self_contained
-
         # check the element exists in the SpatialData object
         element = self.get(element_name)
         if element is None:
@@ -1361,8 +1566,31 @@ class SpatialData:
             return None
 
         element_type = self._element_type_from_element_name(element_name)
+        if not self._validate_can_write_metadata_on_located_element(element_type, element_name, element):
+            return None
+        return element_type, element
 
-        self._check_element_not_on_disk_with_different_type(element_type=element_type, element_name=element_name)
+    def _validate_can_write_metadata_on_located_element(
+        self,
+        element_type: str,
+        element_name: str,
+        element: SpatialElement | AnnData,
+        elements_paths_on_disk: list[str] | None = None,
+    ) -> bool:
+        """Like `_validate_can_write_metadata_on_element`, for an element whose type has already been resolved."""
+        from spatialdata._io._utils import _is_element_self_contained
+
+        if self.path is None:
+            warnings.warn(
+                "The SpatialData object appears not to be backed by a Zarr storage, so metadata cannot be written.",
+                UserWarning,
+                stacklevel=3,
+            )
+            return False
+
+        self._check_element_not_on_disk_with_different_type(
+            element_type=element_type, element_name=element_name, elements_paths_on_disk=elements_paths_on_disk
+        )
 
         # check if the element exists in the Zarr storage
         if not self._group_for_element_exists(
@@ -1372,20 +1600,20 @@ class SpatialData:
                 f"Not saving the metadata to element {element_type}/{element_name} as it is"
                 " not found in Zarr storage. You may choose to call write_element() first.",
                 UserWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
-            return None
+            return False
 
         # warn the users if the element is not self-contained, that is, it is Dask-backed by files outside the Zarr
         # group for the element
-        element_zarr_path = Path(self.path) / element_type / element_name
+        element_zarr_path = self.path / element_type / element_name
         if not _is_element_self_contained(element=element, element_path=element_zarr_path):
             logger.info(
                 f"Element {element_type}/{element_name} is not self-contained. The metadata will be"
                 " saved to the Zarr group of the element in the SpatialData Zarr store. The data outside the element "
                 "Zarr group will not be affected."
             )
-        return element_type, element
+        return True
 
     def write_transformations(self, element_name: str | None = None) -> None:
         """
@@ -1396,48 +1624,42 @@ class SpatialData:
         element_name
             The name of the element to write. If None, write the transformations of all elements.
         """
-        from spatialdata._core._elements import Elements
-
         if element_name is not None:
             Elements._check_valid_name(element_name)
 
-        # recursively write the transformation for all the SpatialElement
+        # write the transformation for all the SpatialElement; the element types are already known from the
+        # iteration and the content of the Zarr store is listed only once
         if element_name is None:
-            for _, element_name, _ in self._gen_elements():
-                self.write_transformations(element_name)
+            self._validate_element_names_are_unique()
+            elements_paths_on_disk = self.elements_paths_on_disk() if self.path is not None else None
+            for element_type, element_name, element in self._gen_elements():
+                if self._validate_can_write_metadata_on_located_element(
+                    element_type, element_name, element, elements_paths_on_disk=elements_paths_on_disk
+                ):
+                    self._write_transformations_one(element_type, element_name, element)
             return
 
         validation_result = self._validate_can_write_metadata_on_element(element_name)
         if validation_result is None:
             return
         element_type, element = validation_result
+        self._write_transformations_one(element_type, element_name, element)
 
-        from spatialdata.transformations.operations import get_transformation
-
+    def _write_transformations_one(
+        self, element_type: str, element_name: str, element: SpatialElement | AnnData
+    ) -> None:
+        """Write the transformations of an element that has already been validated for writing metadata."""
         transformations = get_transformation(element, get_all=True)
-        assert isinstance(transformations, dict)
 
         assert self.path is not None
         _, _, element_group = self._get_groups_for_element(
-            zarr_path=Path(self.path), element_type=element_type, element_name=element_name
+            zarr_path=self.path, element_type=element_type, element_name=element_name
         )
         axes = get_axes_names(element)
-        if isinstance(element, (SpatialImage, MultiscaleSpatialImage)):
-            from spatialdata._io._utils import (
-                overwrite_coordinate_transformations_raster,
-            )
-
-            overwrite_coordinate_transformations_raster(group=element_group, axes=axes, transformations=transformations)
-        elif isinstance(element, (DaskDataFrame, GeoDataFrame, AnnData)):
-            from spatialdata._io._utils import (
-                overwrite_coordinate_transformations_non_raster,
-            )
-
-            overwrite_coordinate_transformations_non_raster(
-                group=element_group, axes=axes, transformations=transformations
-            )
-        else:
+        transformations_writer = _get_transformations_writers().get(element_type)
+        if transformations_writer is None:
             raise ValueError(f"Unknown element type {type(element)}")
+        transformations_writer(group=element_group, axes=axes, transformations=transformations)
 
     def _element_type_from_element_name(self, element_name: str) -> str:
         self._validate_element_names_are_unique()
@@ -1445,15 +1667,10 @@ class SpatialData:
         if element is None:
             raise ValueError(f"Element with name {element_name} not found in SpatialData object.")
 
-        located = self.locate_element(element)
-        element_type = None
-        for path in located:
-            found_element_type, found_element_name = path.split("/")
-            if element_name == found_element_name:
-                element_type = found_element_type
-                break
-        if element_type is None:
-            pass
+        element_type = next(
+            (found_type for found_type, found_name in self._locate_element(element) if found_name == element_name),
+            None,
+        )
         assert element_type is not None
         return element_type
 
@@ -1486,8 +1703,6 @@ class SpatialData:
         -----
         When using the methods `write()` and `write_element()`, the metadata is written automatically.
         """
-        from spatialdata._core._elements import Elements
-
         if element_name is not None:
             Elements._check_valid_name(element_name)
 
@@ -1496,6 +1711,12 @@ class SpatialData:
         # TODO: write .attrs['spatialdata_attrs'] metadata for DaskDataFrame.
         # TODO: write omero metadata for the channel name of images.
 
+        if self.path is None:
+            # write_transformations() has already warned that the object is not backed by a Zarr storage
+            return
+        # open the store in write mode once, so that the probe for the consolidated metadata and the consolidation
+        # share the same store (has_consolidated_metadata() reuses the cached root group)
+        self._get_zarr_root(self.path, mode="r+")
         if consolidate_metadata is None and self.has_consolidated_metadata():
             consolidate_metadata = True
         if consolidate_metadata:
@@ -1517,10 +1738,10 @@ class SpatialData:
     @tables.setter
     def tables(self, shapes: dict[str, GeoDataFrame]) -> None:
         """Set tables."""
-        self._shared_keys = self._shared_keys - set(self._tables.keys())
+        # update the shared set in place: it is the same object referenced by all the other element containers
+        self._shared_keys.difference_update(self._tables)
         self._tables = Tables(shared_keys=self._shared_keys)
-        for k, v in shapes.items():
-            self._tables[k] = v
+        self._tables.update(shapes)
 
     @property
     def table(self) -> None | AnnData:
@@ -1548,7 +1769,7 @@ class SpatialData:
             DeprecationWarning,
             stacklevel=2,
         )
-        TableModel().validate(table)
+        Table_s.validate(table)
         if self.tables.get("table") is not None:
             raise ValueError("The table already exists. Use del sdata.tables['table'] to remove it first.")
         self.tables["table"] = table
@@ -1633,10 +1854,9 @@ class SpatialData:
     @images.setter
     def images(self, images: dict[str, Raster_T]) -> None:
         """Set images."""
-        self._shared_keys = self._shared_keys - set(self._images.keys())
+        self._shared_keys.difference_update(self._images)
         self._images = Images(shared_keys=self._shared_keys)
-        for k, v in images.items():
-            self._images[k] = v
+        self._images.update(images)
 
     @property
     def labels(self) -> Labels:
@@ -1646,10 +1866,9 @@ class SpatialData:
     @labels.setter
     def labels(self, labels: dict[str, Raster_T]) -> None:
         """Set labels."""
-        self._shared_keys = self._shared_keys - set(self._labels.keys())
+        self._shared_keys.difference_update(self._labels)
         self._labels = Labels(shared_keys=self._shared_keys)
-        for k, v in labels.items():
-            self._labels[k] = v
+        self._labels.update(labels)
 
     @property
     def points(self) -> Points:
@@ -1659,10 +1878,9 @@ class SpatialData:
     @points.setter
     def points(self, points: dict[str, DaskDataFrame]) -> None:
         """Set points."""
-        self._shared_keys = self._shared_keys - set(self._points.keys())
+        self._shared_keys.difference_update(self._points)
         self._points = Points(shared_keys=self._shared_keys)
-        for k, v in points.items():
-            self._points[k] = v
+        self._points.update(points)
 
     @property
     def shapes(self) -> Shapes:
@@ -1672,22 +1890,16 @@ class SpatialData:
     @shapes.setter
     def shapes(self, shapes: dict[str, GeoDataFrame]) -> None:
         """Set shapes."""
-        self._shared_keys = self._shared_keys - set(self._shapes.keys())
+        self._shared_keys.difference_update(self._shapes)
         self._shapes = Shapes(shared_keys=self._shared_keys)
-        for k, v in shapes.items():
-            self._shapes[k] = v
+        self._shapes.update(shapes)
 
     @property
     def coordinate_systems(self) -> list[str]:
-        from spatialdata.transformations.operations import get_transformation
-
-        all_cs = set()
-        gen = self._gen_spatial_element_values()
-        for obj in gen:
+        all_cs: set[str] = set()
+        for obj in self._gen_spatial_element_values():
             transformations = get_transformation(obj, get_all=True)
-            assert isinstance(transformations, dict)
-            for cs in transformations:
-                all_cs.add(cs)
+            all_cs.update(transformations)
         return list(all_cs)
 
     def _non_empty_elements(self) -> list[str]:
@@ -1698,12 +1910,7 @@ class SpatialData:
         non_empty_elements
             The names of the elements that are not empty.
         """
-        all_elements = ["images", "labels", "points", "shapes", "tables"]
-        return [
-            element
-            for element in all_elements
-            if (getattr(self, element) is not None) and (len(getattr(self, element)) > 0)
-        ]
+        return [element_type for element_type, container in self._element_containers() if len(container) > 0]
 
     def __repr__(self) -> str:
         return self._gen_repr()
@@ -1718,45 +1925,42 @@ class SpatialData:
         -------
             The string representation of the SpatialData object.
         """
-        from spatialdata._utils import _natural_keys
-
-        def rreplace(s: str, old: str, new: str, occurrence: int) -> str:
-            li = s.rsplit(old, occurrence)
-            return new.join(li)
-
-        def h(s: str) -> str:
-            return hashlib.md5(repr(s).encode()).hexdigest()
-
-        descr = "SpatialData object"
+        parts = ["SpatialData object"]
         if self.path is not None:
-            descr += f", with associated Zarr store: {self.path.resolve()}"
+            parts.append(f", with associated Zarr store: {self.path.resolve()}")
 
+        # the tree is drawn while the description is built: the last attribute and the last element of each attribute
+        # are known in advance, so each line gets its final branch characters directly
         non_empty_elements = self._non_empty_elements()
         last_element_index = len(non_empty_elements) - 1
         for attr_index, attr in enumerate(non_empty_elements):
             last_attr = attr_index == last_element_index
             attribute = getattr(self, attr)
 
-            descr += f"\n{h('level0')}{attr.capitalize()}"
+            parts.append(f"\n{'└── ' if last_attr else '├── '}{attr.capitalize()}")
+            empty_line = "\n  " if last_attr else "\n│ "
 
             unsorted_elements = attribute.items()
             sorted_elements = sorted(unsorted_elements, key=lambda x: _natural_keys(x[0]))
+            last_k = sorted_elements[-1][0]
             for k, v in sorted_elements:
-                descr += f"{h('empty_line')}"
+                branch = f"{empty_line}{'    └── ' if k == last_k else '    ├── '}"
                 descr_class = v.__class__.__name__
                 if attr == "shapes":
-                    descr += f"{h(attr + 'level1.1')}{k!r}: {descr_class} " f"shape: {v.shape} (2D shapes)"
+                    parts.append(f"{branch}{k!r}: {descr_class} shape: {v.shape} (2D shapes)")
                 elif attr == "points":
                     length: int | None = None
                     if len(v.dask.layers) == 1:
                         name, layer = v.dask.layers.items().__iter__().__next__()
                         if "read-parquet" in name:
+                            # imported here to avoid a circular import (spatialdata._io imports SpatialData)
+                            from spatialdata._io.io_points import _get_points_parquet_num_rows
+
                             t = layer.creation_info["args"]
                             assert isinstance(t, tuple)
                             assert len(t) == 1
                             parquet_file = t[0]
-                            table = read_parquet(parquet_file)
-                            length = len(table)
+                            length = _get_points_parquet_num_rows(parquet_file)
                         else:
                             # length = len(v)
                             length = None
@@ -1766,106 +1970,101 @@ class SpatialData:
                     n = len(get_axes_names(v))
                     dim_string = f"({n}D points)"
 
-                    assert len(v.shape) == 2
+                    # the shape of a Dask dataframe is rebuilt (as a new Dask graph for the number of rows) on each
+                    # access
+                    shape = v.shape
+                    assert len(shape) == 2
                     if length is not None:
-                        shape_str = f"({length}, {v.shape[1]})"
+                        shape_str = f"({length}, {shape[1]})"
                     else:
-                        shape_str = (
-                            "("
-                            + ", ".join([str(dim) if not isinstance(dim, Delayed) else "<Delayed>" for dim in v.shape])
-                            + ")"
-                        )
-                    descr += f"{h(attr + 'level1.1')}{k!r}: {descr_class} " f"with shape: {shape_str} {dim_string}"
+                        dims_str = ", ".join(str(dim) if not isinstance(dim, Delayed) else "<Delayed>" for dim in shape)
+                        shape_str = f"({dims_str})"
+                    parts.append(f"{branch}{k!r}: {descr_class} with shape: {shape_str} {dim_string}")
                 elif attr == "tables":
-                    descr += f"{h(attr + 'level1.1')}{k!r}: {descr_class} {v.shape}"
+                    parts.append(f"{branch}{k!r}: {descr_class} {v.shape}")
                 else:
                     if isinstance(v, SpatialImage):
-                        descr += f"{h(attr + 'level1.1')}{k!r}: {descr_class}[{''.join(v.dims)}] {v.shape}"
+                        parts.append(f"{branch}{k!r}: {descr_class}[{''.join(v.dims)}] {v.shape}")
                     elif isinstance(v, MultiscaleSpatialImage):
                         shapes = []
                         dims: str | None = None
                         for pyramid_level in v:
-                            dataset_names = list(v[pyramid_level].keys())
-                            assert len(dataset_names) == 1
-                            dataset_name = dataset_names[0]
-                            vv = v[pyramid_level][dataset_name]
-                            shape = vv.shape
+                            # each scale holds a single data array, accessed once per scale
+                            scale_arrays = list(v[pyramid_level].values())
+                            assert len(scale_arrays) == 1
+                            vv = scale_arrays[0]
                             if dims is None:
                                 dims = "".join(vv.dims)
-                            shapes.append(shape)
-                        descr += f"{h(attr + 'level1.1')}{k!r}: {descr_class}[{dims}] " f"{', '.join(map(str, shapes))}"
+                            shapes.append(vv.shape)
+                        parts.append(f"{branch}{k!r}: {descr_class}[{dims}] {', '.join(map(str, shapes))}")
                     else:
                         raise TypeError(f"Unknown type {type(v)}")
-            if last_attr is True:
-                descr = descr.replace(h("empty_line"), "\n  ")
-            else:
-                descr = descr.replace(h("empty_line"), "\n│ ")
-
-        descr = rreplace(descr, h("level0"), "└── ", 1)
-        descr = descr.replace(h("level0"), "├── ")
-
-        for attr in ["images", "labels", "points", "tables", "shapes"]:
-            descr = rreplace(descr, h(attr + "level1.1"), "    └── ", 1)
-            descr = descr.replace(h(attr + "level1.1"), "    ├── ")
-
-        from spatialdata.transformations.operations import get_transformation
 
-        descr += "\nwith coordinate systems:\n"
-        coordinate_systems = self.coordinate_systems.copy()
-        coordinate_systems.sort(key=_natural_keys)
+        parts.append("\nwith coordinate systems:\n")
+        # the transformations of each spatial element are fetched once, and not once per coordinate system; the
+        # elements are sorted by name (within each element type) once, so that filtering them per coordinate system
+        # keeps them ordered
+        elements_css: list[tuple[str, frozenset[str]]] = [
+            (f"{name} ({element_type.capitalize()})", frozenset(get_transformation(obj, get_all=True)))
+            for element_type, container in self._element_containers()
+            if element_type != "tables"
+            for name, obj in sorted(container.items(), key=lambda x: _natural_keys(x[0]))
+        ]
+        coordinate_systems = sorted(frozenset().union(*(css for _, css in elements_css)), key=_natural_keys)
         for i, cs in enumerate(coordinate_systems):
-            descr += f"    ▸ {cs!r}"
-            gen = self._gen_elements()
-            elements_in_cs: dict[str, list[str]] = {}
-            for k, name, obj in gen:
-                if not isinstance(obj, AnnData):
-                    transformations = get_transformation(obj, get_all=True)
-                    assert isinstance(transformations, dict)
-                    target_css = transformations.keys()
-                    if cs in target_css:
-                        if k not in elements_in_cs:
-                            elements_in_cs[k] = []
-                        elements_in_cs[k].append(name)
-            for element_names in elements_in_cs.values():
-                element_names.sort(key=_natural_keys)
-            if len(elements_in_cs) > 0:
-                elements = ", ".join(
-                    [
-                        f"{element_name} ({element_type.capitalize()})"
-                        for element_type, element_names in elements_in_cs.items()
-                        for element_name in element_names
-                    ]
-                )
-                descr += f", with elements:\n        {elements}"
+            parts.append(f"    ▸ {cs!r}")
+            elements = ", ".join(description for description, css in elements_css if cs in css)
+            if elements:
+                parts.append(f", with elements:\n        {elements}")
             if i < len(coordinate_systems) - 1:
-                descr += "\n"
-
-        from spatialdata._io._utils import get_dask_backing_files
+                parts.append("\n")
 
         def _element_path_to_element_name_with_type(element_path: str) -> str:
             element_type, element_name = element_path.split("/")
             return f"{element_name} ({element_type.capitalize()})"
 
-        if not self.is_self_contained():
-            assert self.path is not None
-            descr += "\nwith the following Dask-backed elements not being self-contained:"
+        if self.path is not None:
+            # a single pass over the Dask graphs of the elements, instead of one to check if the object is
+            # self-contained and one to find the elements that are not
             description = self.elements_are_self_contained()
-            for _, element_name, element in self.gen_elements():
-                if not description[element_name]:
+            not_self_contained = [
+                (element_name, element)
+                for _, element_name, element in self.gen_elements()
+                if not description[element_name]
+            ]
+            if len(not_self_contained) > 0:
+                from spatialdata._io._utils import get_dask_backing_files
+
+                parts.append("\nwith the following Dask-backed elements not being self-contained:")
+                for element_name, element in not_self_contained:
                     backing_files = ", ".join(get_dask_backing_files(element))
-                    descr += f"\n    ▸ {element_name}: {backing_files}"
+                    parts.append(f"\n    ▸ {element_name}: {backing_files}")
 
-        if self.path is not None:
             elements_only_in_sdata, elements_only_in_zarr = self._symmetric_difference_with_zarr_store()
             if len(elements_only_in_sdata) > 0:
-                descr += "\nwith the following elements not in the Zarr store:"
+                parts.append("\nwith the following elements not in the Zarr store:")
                 for element_path in elements_only_in_sdata:
-                    descr += f"\n    ▸ {_element_path_to_element_name_with_type(element_path)}"
+                    parts.append(f"\n    ▸ {_element_path_to_element_name_with_type(element_path)}")
             if len(elements_only_in_zarr) > 0:
-                descr += "\nwith the following elements in the Zarr store but not in the SpatialData object:"
+                parts.append("\nwith the following elements in the Zarr store but not in the SpatialData object:")
                 for element_path in elements_only_in_zarr:
-                    descr += f"\n    ▸ {_element_path_to_element_name_with_type(element_path)}"
-        return descr
+                    parts.append(f"\n    ▸ {_element_path_to_element_name_with_type(element_path)}")
+        return "".join(parts)
+
+    def _element_containers(self) -> tuple[tuple[str, Elements], ...]:
+        """Return the (element type, element container) pairs, in the order in which the elements are generated."""
+        return (
+            ("images", self._images),
+            ("labels", self._labels),
+            ("points", self._points),
+            ("shapes", self._shapes),
+            ("tables", self._tables),
+        )
+
+    def _gen_element_names(self) -> Generator[str, None, None]:
+        """Generate the names of all the elements (tables included), for callers that need neither types nor values."""
+        for _, d in self._element_containers():
+            yield from d
 
     def _gen_spatial_element_values(self) -> Generator[SpatialElement, None, None]:
         """
@@ -1877,9 +2076,9 @@ class SpatialData:
             A generator that yields spatial element objects contained in the SpatialData instance.
 
         """
-        for element_type in ["images", "labels", "points", "shapes"]:
-            d = getattr(SpatialData, element_type).fget(self)
-            yield from d.values()
+        for element_type, d in self._element_containers():
+            if element_type != "tables":
+                yield from d.values()
 
     def _gen_elements(
         self, include_table: bool = False
@@ -1897,13 +2096,10 @@ class SpatialData:
         A generator object that returns a tuple containing the type of the element, its name, and the element
         itself.
         """
-        element_types = ["images", "labels", "points", "shapes"]
-        if include_table:
-            element_types.append("tables")
-        for element_type in element_types:
-            d = getattr(SpatialData, element_type).fget(self)
-            for k, v in d.items():
-                yield element_type, k, v
+        for element_type, d in self._element_containers():
+            if include_table or element_type != "tables":
+                for k, v in d.items():
+                    yield element_type, k, v
 
     def gen_spatial_elements(self) -> Generator[tuple[str, str, SpatialElement], None, None]:
         """
@@ -1939,8 +2135,13 @@ class SpatialData:
         ValueError
             If the element names are not unique.
         """
+        # the containers reject names already present in the shared set of keys, so the names are unique when the
+        # shared set accounts for exactly all the elements; the full scan is only needed when the containers have been
+        # modified bypassing that check
+        if sum(len(container) for _, container in self._element_containers()) == len(self._shared_keys):
+            return
         element_names = set()
-        for _, element_name, _ in self.gen_elements():
+        for element_name in self._gen_element_names():
             if element_name in element_names:
                 raise ValueError(f"Element name {element_name!r} is not unique.")
             element_names.add(element_name)
@@ -1967,10 +2168,12 @@ class SpatialData:
         KeyError
             If the element with the given name cannot be found.
         """
-        found = []
-        for element_type, element_name_, element in self.gen_elements():
-            if element_name_ == element_name:
-                found.append((element_type, element_name_, element))
+        # the containers are dictionaries keyed by the element names, so each one is probed with a single lookup
+        found = [
+            (element_type, element_name, container[element_name])
+            for element_type, container in self._element_containers()
+            if element_name in container
+        ]
 
         if len(found) == 0:
             raise KeyError(f"Could not find element with name {element_name!r}")
@@ -2002,15 +2205,10 @@ class SpatialData:
         elements_dict: dict[str, SpatialElement] = {}
         for name, element in elements.items():
             model = get_model(element)
-            if model in [Image2DModel, Image3DModel]:
-                element_type = "images"
-            elif model in [Labels2DModel, Labels3DModel]:
-                element_type = "labels"
-            elif model == PointsModel:
-                element_type = "points"
-            else:
-                assert model == ShapesModel
-                element_type = "shapes"
+            element_type = _SCHEMA_TO_ELEMENT_TYPE.get(model)
+            # the tables are passed separately
+            if element_type is None or element_type == "tables":
+                raise ValueError(f"Unknown schema {model}")
             elements_dict.setdefault(element_type, {})[name] = element
         return cls(**elements_dict, tables=tables)
 
@@ -2038,12 +2236,15 @@ class SpatialData:
         """
         elements_dict: dict[str, SpatialElement] = {}
         names_tables_to_keep: set[str] = set()
-        for element_type, element_name, element in self._gen_elements(include_table=True):
-            if element_name in element_names:
-                if element_type != "tables":
-                    elements_dict.setdefault(element_type, {})[element_name] = element
-                else:
-                    names_tables_to_keep.add(element_name)
+        # look up the requested names in the containers instead of testing every element against the list of names
+        containers = self._element_containers()
+        for element_name in dict.fromkeys(element_names):
+            for element_type, container in containers:
+                if element_name in container:
+                    if element_type != "tables":
+                        elements_dict.setdefault(element_type, {})[element_name] = container[element_name]
+                    else:
+                        names_tables_to_keep.add(element_name)
         tables = self._filter_tables(
             names_tables_to_keep,
             filter_tables,
@@ -2070,10 +2271,7 @@ class SpatialData:
         return element
 
     def __contains__(self, key: str) -> bool:
-        element_dict = {
-            element_name: element_value for _, element_name, element_value in self._gen_elements(include_table=True)
-        }
-        return key in element_dict
+        return any(key in container for _, container in self._element_containers())
 
     def get(self, key: str, default_value: SpatialElement | AnnData | None = None) -> SpatialElement | AnnData | None:
         """
@@ -2090,11 +2288,10 @@ class SpatialData:
         -------
         The SpatialData element associated with the given key, if found. Otherwise, the default value is returned.
         """
-        for _, element_name_, element in self.gen_elements():
-            if element_name_ == key:
-                return element
-        else:
-            return default_value
+        for _, container in self._element_containers():
+            if key in container:
+                return container[key]
+        return default_value
 
     def __setitem__(self, key: str, value: SpatialElement | AnnData) -> None:
         """
@@ -2108,18 +2305,10 @@ class SpatialData:
             The element.
         """
         schema = get_model(value)
-        if schema in (Image2DModel, Image3DModel):
-            self.images[key] = value
-        elif schema in (Labels2DModel, Labels3DModel):
-            self.labels[key] = value
-        elif schema == PointsModel:
-            self.points[key] = value
-        elif schema == ShapesModel:
-            self.shapes[key] = value
-        elif schema == TableModel:
-            self.tables[key] = value
-        else:
+        element_type = _SCHEMA_TO_ELEMENT_TYPE.get(schema)
+        if element_type is None:
             raise TypeError(f"Unknown element type with schema: {schema!r}.")
+        getattr(self, element_type)[key] = value
 
     def __delitem__(self, key: str) -> None:
         """
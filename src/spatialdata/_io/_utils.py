@@ -376,9 +376,9 @@ def read_table_and_validate(
     The modified dictionary with the tables.
     """
     count = 0
+    subgroup_path = zarr_store_path / subgroup.path
     for table_name in subgroup:
-        f_elem = subgroup[table_name]
-        f_elem_store = _open_zarr_store(zarr_store_path / f_elem.path)
+        f_elem_store = _open_zarr_store(subgroup_path / table_name)
         # we can replace read_elem with read_anndata_zarr after this PR gets into a release (>= 0.6.5)
         # https://github.com/scverse/anndata/pull/1057#pullrequestreview-1530623183
         tables[table_name] = read_anndata_zarr(f_elem_store)
@@ -1,9 +1,12 @@
 import os
 from pathlib import Path
+from typing import Any
 
+import pyarrow.dataset as ds
 import zarr
 from dask.dataframe import DataFrame as DaskDataFrame  # type: ignore[attr-defined]
 from dask.dataframe import read_parquet
+from fsspec.core import url_to_fs
 from ome_zarr.format import Format
 from upath import UPath
 
@@ -22,6 +25,49 @@ from spatialdata.transformations._utils import (
 )
 
 
+def _read_points_parquet(path: str, **kwargs: Any) -> DaskDataFrame:
+    """
+    Read the parquet file of a points element.
+
+    Row groups are split into partitions adaptively (according to the dask blocksize) and, for remote files that are
+    not already cached locally, the byte ranges needed by the parquet reader are prefetched in bulk.
+
+    Parameters
+    ----------
+    path
+        Path or URL of the parquet file.
+    kwargs
+        Additional keyword arguments passed to :func:`dask.dataframe.read_parquet`.
+
+    Returns
+    -------
+    The points as a dask dataframe.
+    """
+    kwargs.setdefault("split_row_groups", "adaptive")
+    if "://" in path and not path.startswith("simplecache::"):
+        kwargs.setdefault("open_file_options", {"precache_options": {"method": "parquet"}})
+    return read_parquet(path, engine="pyarrow", **kwargs)
+
+
+def _get_points_parquet_num_rows(path: str) -> int:
+    """
+    Get the number of rows of the parquet file (or directory of parquet files) of a points element.
+
+    Only the footers of the parquet files are read, since they store the number of rows of each row group.
+
+    Parameters
+    ----------
+    path
+        Path or URL of the parquet file.
+
+    Returns
+    -------
+    The number of rows.
+    """
+    fs, fs_path = url_to_fs(path)
+    return int(ds.dataset(fs_path, filesystem=fs, format="parquet").count_rows())
+
+
 def _read_points(
     path: UPath,
     fmt: SpatialDataFormatV01 = CurrentPointsFormat(),
@@ -33,13 +79,13 @@ def _read_points(
     if isinstance(store, UPath):
         path = store / "points.parquet"
         read_str = "simplecache::" + path.as_posix() if "http" in path.protocol else path.as_posix()
-        table = read_parquet(read_str)
+        table = _read_points_parquet(read_str)
     else:
         # TODO: remove this old code path
-        path = os.path.join(f._store.path, f.path, "points.parquet")
+        parquet_path = os.path.join(f._store.path, f.path, "points.parquet")
         # cache on remote file needed for parquet reader to work
         # TODO: allow reading in the metadata without caching all the data
-        table = read_parquet("simplecache::" + path if "http" in path else path)
+        table = _read_points_parquet("simplecache::" + parquet_path if "http" in parquet_path else parquet_path)
     assert isinstance(table, DaskDataFrame)
 
     transformations = _get_transformations_from_ngff_dict(f.attrs.asdict()["coordinateTransformations"])
@@ -1,14 +1,18 @@
 import logging
+import sys
 import warnings
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import zarr
 import zarr.storage
 from anndata import AnnData
 from upath import UPath
 
-from spatialdata._core._utils import _open_zarr_store
+from spatialdata._core._utils import _is_remote_path, _open_zarr_store
 from spatialdata._core.spatialdata import SpatialData
 from spatialdata._io._utils import ome_zarr_logger, read_table_and_validate
 from spatialdata._io.io_points import _read_points
@@ -17,6 +21,66 @@ from spatialdata._io.io_shapes import _read_shapes
 from spatialdata._logging import logger
 
 
+def _open_root_group(store: zarr.storage.BaseStore) -> zarr.Group:
+    """
+    Open the root group of a remote SpatialData Zarr store, using the consolidated metadata when present.
+
+    With the consolidated metadata (written by default by `SpatialData.write()`), the structure of the store is read
+    with a single request instead of one listing per group. Stores without consolidated metadata fall back to a
+    regular group. Local stores should be opened with `zarr.group()` instead: listing them is cheap, and it does not
+    miss elements written after the metadata was last consolidated (e.g. by external tools).
+    """
+    if isinstance(store, zarr.storage.ConsolidatedMetadataStore):
+        return zarr.group(store)
+    try:
+        # TODO: Because of bug https://github.com/zarr-developers/zarr-python/issues/1121
+        # .zmetadata is not supported when using an FSStore, hence the metadata key zmetadata.
+        return zarr.open_consolidated(store, mode="r", metadata_key="zmetadata")
+    except KeyError:
+        return zarr.group(store)
+
+
+def _list_subgroup_names(group: zarr.Group) -> list[str]:
+    """List the names in a group once, skipping hidden files like .zgroup or .zmetadata."""
+    # the names become the keys of the element containers and of the shared set of keys; interning them lets the
+    # lookups with the same names short-circuit on identity
+    return [sys.intern(name) for name in group if not name.startswith(".")]
+
+
+def _read_element_group(
+    f_store_path: UPath, group: zarr.Group, reader: Callable[[UPath], Any], parallel: bool = False
+) -> dict[str, Any]:
+    """
+    Read all the elements of an element-type group (e.g. the images group) with the given element reader.
+
+    If `parallel` is True, the elements are read concurrently by a pool of threads, which hides the latency of remote
+    stores since reading an element is mostly waiting for I/O.
+    """
+    # the paths of the elements are derived from the path of the group, opening each subgroup only to get its path
+    # would read its metadata from the store; the path of the group is joined to the store path only once
+    group_path = f_store_path / group.path
+    element_paths = [(name, group_path / name) for name in _list_subgroup_names(group)]
+    if parallel and len(element_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, len(element_paths))) as executor:
+            # map() preserves the order of the elements and re-raises the first exception raised by a read
+            read = list(executor.map(reader, (path for _, path in element_paths)))
+        elements = {name: element for (name, _), element in zip(element_paths, read)}
+    else:
+        elements = {name: reader(path) for name, path in element_paths}
+    logger.debug(f"Found {len(elements)} elements in {group}")
+    return elements
+
+
+# readers of the single elements, from the path of the element in the store; the tables are read separately by
+# read_table_and_validate()
+_ELEMENT_READERS: dict[str, Callable[[UPath], Any]] = {
+    "images": lambda path: _read_multiscale(_open_zarr_store(path), raster_type="image"),
+    "labels": lambda path: _read_multiscale(_open_zarr_store(path), raster_type="labels"),
+    "points": _read_points,
+    "shapes": lambda path: _read_shapes(_open_zarr_store(path)),
+}
+
+
 def read_zarr(store: Union[str, Path, zarr.Group, UPath], selection: Optional[tuple[str]] = None) -> SpatialData:
     """
     Read a SpatialData dataset from a zarr store (on-disk or remote).
@@ -41,76 +105,25 @@ def read_zarr(store: Union[str, Path, zarr.Group, UPath], selection: Optional[tu
     else:
         f_store_path = UPath(store) if not isinstance(store, UPath) else store
         f = _open_zarr_store(f_store_path)
-    root = zarr.group(f)
-
-    images = {}
-    labels = {}
-    points = {}
+    # local reads are not latency-bound, so they do not pay for the threads nor trust possibly stale consolidated
+    # metadata
+    remote = _is_remote_path(f_store_path)
+    root = _open_root_group(f) if remote else zarr.group(f)
+    elements: dict[str, dict[str, Any]] = {}
     tables: dict[str, AnnData] = {}
-    shapes = {}
 
     # TODO: remove table once deprecated.
     selector = {"images", "labels", "points", "shapes", "tables", "table"} if not selection else set(selection or [])
     logger.debug(f"Reading selection {selector}")
 
-    # read multiscale images
-    if "images" in selector and "images" in root:
-        group = root["images"]
-        count = 0
-        for subgroup_name in group:
-            if subgroup_name.startswith("."):
-                # skip hidden files like .zgroup or .zmetadata
-                continue
-            f_elem = group[subgroup_name]
-            f_elem_store = _open_zarr_store(f_store_path / f_elem.path)
-            element = _read_multiscale(f_elem_store, raster_type="image")
-            images[subgroup_name] = element
-            count += 1
-        logger.debug(f"Found {count} elements in {group}")
-
-    # read multiscale labels
-    with ome_zarr_logger(logging.ERROR):
-        if "labels" in selector and "labels" in root:
-            group = root["labels"]
-            count = 0
-            for subgroup_name in group:
-                if subgroup_name.startswith("."):
-                    # skip hidden files like .zgroup or .zmetadata
-                    continue
-                f_elem = group[subgroup_name]
-                f_elem_store = _open_zarr_store(f_store_path / f_elem.path)
-                labels[subgroup_name] = _read_multiscale(f_elem_store, raster_type="labels")
-                count += 1
-            logger.debug(f"Found {count} elements in {group}")
-
-    # now read rest of the data
-    if "points" in selector and "points" in root:
-        group = root["points"]
-        count = 0
-        for subgroup_name in group:
-            f_elem = group[subgroup_name]
-            if subgroup_name.startswith("."):
-                # skip hidden files like .zgroup or .zmetadata
-                continue
-            points[subgroup_name] = _read_points(f_store_path / f_elem.path)
-            count += 1
-        logger.debug(f"Found {count} elements in {group}")
-
-    if "shapes" in selector and "shapes" in root:
-        group = root["shapes"]
-        count = 0
-        for subgroup_name in group:
-            if subgroup_name.startswith("."):
-                # skip hidden files like .zgroup or .zmetadata
-                continue
-            f_elem = group[subgroup_name]
-            f_elem_store = _open_zarr_store(f_store_path / f_elem.path)
-            shapes[subgroup_name] = _read_shapes(f_elem_store)
-            count += 1
-        logger.debug(f"Found {count} elements in {group}")
+    for element_type, reader in _ELEMENT_READERS.items():
+        if element_type in selector and element_type in root:
+            # the logger of ome-zarr is verbose when reading labels
+            with ome_zarr_logger(logging.ERROR) if element_type == "labels" else nullcontext():
+                elements[element_type] = _read_element_group(f_store_path, root[element_type], reader, parallel=remote)
+
     if "tables" in selector and "tables" in root:
-        group = root["tables"]
-        tables = read_table_and_validate(f_store_path, group, tables)
+        tables = read_table_and_validate(f_store_path, root["tables"], tables)
 
     if "table" in selector and "table" in root:
         warnings.warn(
@@ -119,17 +132,9 @@ def read_zarr(store: Union[str, Path, zarr.Group, UPath], selection: Optional[tu
             DeprecationWarning,
             stacklevel=2,
         )
-        subgroup_name = "table"
-        group = f[subgroup_name]
-        tables = read_table_and_validate(f_store_path, group, tables)
-        logger.debug(f"Found {count} elements in {group}")
-
-    sdata = SpatialData(
-        images=images,
-        labels=labels,
-        points=points,
-        shapes=shapes,
-        tables=tables,
-    )
+        # the tables of the old layout are read into the same dictionary as the ones of the "tables" group
+        tables = read_table_and_validate(f_store_path, root["table"], tables)
+
+    sdata = SpatialData(**elements, tables=tables)
     sdata.path = f_store_path
     return sdata
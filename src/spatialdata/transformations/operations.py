@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import contextlib
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Literal, Optional, Union, overload
 
 import networkx as nx
 import numpy as np
@@ -71,7 +71,7 @@ def set_transformation(
             assert to_coordinate_system is None, "If set_all=True, to_coordinate_system must be None."
             _set_transformations(element, transformation)
     else:
-        located = write_to_sdata.locate_element(element)
+        located = write_to_sdata._locate_element(element)
         if len(located) == 0:
             raise RuntimeError("The element is not found in the SpatialData object.")
         if not write_to_sdata.is_backed():
@@ -86,11 +86,28 @@ def set_transformation(
                 "from all the copies."
             )
         set_transformation(element, transformation, to_coordinate_system, set_all, None)
-        for location in located:
-            element_type, element_name = location.split("/")
+        for _, element_name in located:
             write_to_sdata.write_transformations(element_name=element_name)
 
 
+@overload
+def get_transformation(
+    element: SpatialElement, to_coordinate_system: Optional[str] = None, get_all: Literal[False] = False
+) -> BaseTransformation: ...
+
+
+@overload
+def get_transformation(
+    element: SpatialElement, to_coordinate_system: None = None, *, get_all: Literal[True]
+) -> dict[str, BaseTransformation]: ...
+
+
+@overload
+def get_transformation(
+    element: SpatialElement, to_coordinate_system: Optional[str] = None, get_all: bool = False
+) -> Union[BaseTransformation, dict[str, BaseTransformation]]: ...
+
+
 def get_transformation(
     element: SpatialElement, to_coordinate_system: Optional[str] = None, get_all: bool = False
 ) -> Union[BaseTransformation, dict[str, BaseTransformation]]:
@@ -175,7 +192,7 @@ def remove_transformation(
             assert to_coordinate_system is None, "If remove_all=True, to_coordinate_system must be None."
             _set_transformations(element, {})
     else:
-        located = write_to_sdata.locate_element(element)
+        located = write_to_sdata._locate_element(element)
         if len(located) == 0:
             raise RuntimeError("The element is not found in the SpatialData object.")
         if not write_to_sdata.is_backed():
@@ -190,8 +207,7 @@ def remove_transformation(
                 "from all the copies."
             )
         remove_transformation(element, to_coordinate_system, remove_all, None)
-        for location in located:
-            element_type, element_name = location.split("/")
+        for _, element_name in located:
             write_to_sdata.write_transformations(element_name=element_name)
 
 
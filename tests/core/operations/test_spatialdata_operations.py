@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 
 import numpy as np
+import pandas as pd
 import pytest
 from anndata import AnnData
 from spatialdata._core.concatenate import _concatenate_tables, concatenate
@@ -104,6 +105,10 @@ def test_element_names_unique() -> None:
     assert set(sdata.shapes.keys()) == {"shapes2"}
     assert "shapes2" in sdata._shared_keys
     assert "shapes" not in sdata._shared_keys
+    # the containers that were not replaced still see the keys of the replaced ones
+    assert sdata.labels._shared_keys is sdata._shared_keys
+    with pytest.raises(KeyError):
+        sdata.labels["image2"] = labels
 
 
 def test_element_type_from_element_name(points: SpatialData) -> None:
@@ -113,6 +118,14 @@ def test_element_type_from_element_name(points: SpatialData) -> None:
     assert points._element_type_from_element_name("points_0") == "points"
 
 
+def test_validate_element_names_are_unique(full_sdata: SpatialData) -> None:
+    full_sdata._validate_element_names_are_unique()
+    # bypass the checks of the element containers to create a duplicated name
+    full_sdata.labels.data["image2d"] = full_sdata.labels["labels2d"]
+    with pytest.raises(ValueError, match="is not unique"):
+        full_sdata._validate_element_names_are_unique()
+
+
 def test_filter_by_coordinate_system(full_sdata: SpatialData) -> None:
     sdata = full_sdata.filter_by_coordinate_system(coordinate_system="global", filter_table=False)
     assert_spatial_data_objects_are_identical(sdata, full_sdata)
@@ -450,3 +463,22 @@ def test_validate_table_in_spatialdata(full_sdata):
     del full_sdata.points["points_0"]
     with pytest.warns(UserWarning, match="in the SpatialData object"):
         full_sdata.validate_table_in_spatialdata(table)
+
+
+@pytest.mark.parametrize("dtype", ["object", "category"])
+def test_get_region_key_column(dtype: str) -> None:
+    table = _get_table(region=["circles", "poly"])
+    _, region_key, _ = get_table_keys(table)
+    table.obs[region_key] = table.obs[region_key].astype(dtype)
+    expected = table.obs[region_key].astype(str).tolist()
+
+    region_column = SpatialData.get_region_key_column(table)
+    assert isinstance(region_column.dtype, pd.CategoricalDtype)
+    assert set(region_column.cat.categories) == {"circles", "poly"}
+    assert region_column.astype(str).tolist() == expected
+    # the column stored in the table is not modified
+    assert table.obs[region_key].dtype == dtype
+
+    del table.obs[region_key]
+    with pytest.raises(KeyError, match="column is not found in table.obs"):
+        SpatialData.get_region_key_column(table)
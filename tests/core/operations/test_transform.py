@@ -9,7 +9,7 @@ from multiscale_spatial_image import MultiscaleSpatialImage
 from spatial_image import SpatialImage
 from spatialdata import transform
 from spatialdata._core.data_extent import are_extents_equal, get_extent
-from spatialdata._core.spatialdata import SpatialData
+from spatialdata._core.spatialdata import SpatialData, _exact_transformation_key
 from spatialdata._utils import unpad_raster
 from spatialdata.models import PointsModel, ShapesModel, get_axes_names
 from spatialdata.transformations.operations import (
@@ -685,3 +685,61 @@ def test_transform_until_0_0_15(points):
 
     transform(points, transformation=t0, maintain_positioning=True)
     transform(points, to_coordinate_system="global", maintain_positioning=True)
+
+
+def test_transform_to_coordinate_system_reuses_transformations_of_read_elements(
+    tmp_path: str, full_sdata: SpatialData, monkeypatch
+):
+    scale = Scale([2.0], axes=("x",))
+    for element in full_sdata._gen_spatial_element_values():
+        set_transformation(element, {"global": Identity(), "my_space": scale}, set_all=True)
+    full_sdata.write(Path(tmp_path) / "data.zarr")
+    sdata = SpatialData.read(Path(tmp_path) / "data.zarr")
+
+    import spatialdata._core.spatialdata
+
+    calls = []
+
+    def counting_get_transformation_between_coordinate_systems(*args, **kwargs):
+        calls.append(args)
+        return get_transformation_between_coordinate_systems(*args, **kwargs)
+
+    monkeypatch.setattr(
+        spatialdata._core.spatialdata,
+        "get_transformation_between_coordinate_systems",
+        counting_get_transformation_between_coordinate_systems,
+    )
+    # the elements read from disk have distinct transformation objects, which are equal for the elements with the
+    # same axes
+    _ = sdata.transform_to_coordinate_system("my_space")
+    distinct_transformations = {
+        frozenset((cs, _exact_transformation_key(t)) for cs, t in get_transformation(element, get_all=True).items())
+        for element in sdata._gen_spatial_element_values()
+    }
+    assert len(calls) == len(distinct_transformations) < len(list(sdata._gen_spatial_element_values()))
+
+
+def test_transform_to_coordinate_system_does_not_reuse_almost_equal_transformations():
+    # the translations are equal according to np.allclose(), so they must not share the cached transformation
+    sdata = SpatialData(
+        shapes={
+            f"circles_{x}": ShapesModel.parse(
+                np.array([[0.0, 0.0]]),
+                geometry=0,
+                radius=1,
+                transformations={"aligned": Translation([x, 0], axes=("x", "y"))},
+            )
+            for x in [100000, 100001]
+        }
+    )
+    transformed = sdata.transform_to_coordinate_system("aligned", maintain_positioning=True)
+    for x in [100000, 100001]:
+        element = transformed[f"circles_{x}"]
+        assert element.geometry.x.iloc[0] == x
+        t = get_transformation(element, "aligned")
+        assert np.array_equal(t.to_affine_matrix(input_axes=("x", "y"), output_axes=("x", "y"))[:2, 2], [-x, 0])
+        # the cached and the uncached paths agree
+        uncached = sdata.transform_element_to_coordinate_system(
+            sdata[f"circles_{x}"], "aligned", maintain_positioning=True
+        )
+        assert uncached.geometry.x.iloc[0] == x
@@ -1,9 +1,10 @@
+import shutil
 from pathlib import Path
 
 import pytest
 from anndata import AnnData
 from anndata.tests.helpers import assert_equal
-from spatialdata import SpatialData, concatenate
+from spatialdata import SpatialData, concatenate, read_zarr
 from spatialdata.models import TableModel
 
 from tests.conftest import _get_shapes, _get_table
@@ -12,6 +13,16 @@ from tests.conftest import _get_shapes, _get_table
 test_shapes = _get_shapes()
 
 
+@pytest.fixture
+def legacy_table_store(tmp_path: str) -> tuple[Path, AnnData]:
+    """Zarr store with the layout used before the multi-table support: the table is in a top-level "table" group."""
+    path = Path(tmp_path) / "legacy.zarr"
+    table = _get_table(region="poly")
+    SpatialData(shapes=test_shapes, tables={"table": table}).write(path, consolidate_metadata=False)
+    shutil.move(path / "tables", path / "table")
+    return path, table
+
+
 class TestMultiTable:
     def test_set_get_tables_from_spatialdata(self, full_sdata: SpatialData, tmp_path: str):
         tmpdir = Path(tmp_path) / "tmp.zarr"
@@ -93,6 +104,11 @@ class TestMultiTable:
             match="Annotation target 'non_existing' not present as SpatialElement in SpatialData object.",
         ):
             full_sdata.set_table_annotates_spatialelement("table", "non_existing")
+        with pytest.raises(
+            ValueError,
+            match="Annotation target 'non_existing' not present as SpatialElement in SpatialData object.",
+        ):
+            full_sdata.set_table_annotates_spatialelement("table", ["poly", "non_existing"])
 
     def test_set_table_annotates_spatialelement(self, full_sdata):
         del full_sdata["table"].uns[TableModel.ATTRS_KEY]
@@ -136,6 +152,14 @@ class TestMultiTable:
         full_sdata.tables["my_new_table0"] = adata0
         assert full_sdata.table is None
 
+    def test_read_legacy_table_group(self, legacy_table_store: tuple[Path, AnnData]):
+        path, table = legacy_table_store
+        with pytest.warns(DeprecationWarning, match="Table group found in zarr store"):
+            sdata = read_zarr(path)
+        assert list(sdata.tables) == ["table"]
+        assert_equal(sdata["table"], table)
+        assert "poly" in sdata.shapes
+
     @pytest.mark.parametrize("region", ["test_shapes", "non_existing"])
     def test_single_table(self, tmp_path: str, region: str):
         tmpdir = Path(tmp_path) / "tmp.zarr"
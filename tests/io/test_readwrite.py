@@ -1,14 +1,18 @@
 import os
 import tempfile
+import threading
 from pathlib import Path
 from typing import Any, Callable
 
 import dask.dataframe as dd
 import numpy as np
 import pytest
+import zarr
 from anndata import AnnData
 from numpy.random import default_rng
 from spatialdata import SpatialData, deepcopy, read_zarr
+from spatialdata._core._utils import _open_zarr_store
+from spatialdata._core.spatialdata import _get_element_writers
 from spatialdata._io._utils import _are_directories_identical, get_dask_backing_files
 from spatialdata.datasets import blobs
 from spatialdata.models import Image2DModel
@@ -19,6 +23,7 @@ from spatialdata.transformations.operations import (
     set_transformation,
 )
 from spatialdata.transformations.transformations import Identity, Scale
+from upath import UPath
 
 from tests.conftest import _get_images, _get_labels, _get_points, _get_shapes
 
@@ -150,6 +155,31 @@ class TestReadWrite:
             assert "shapes/new_shapes0" not in shapes.elements_paths_on_disk()
             assert "shapes/new_shapes1" not in shapes.elements_paths_on_disk()
 
+    def test_incremental_io_read_back(self, tmp_path: str, shapes: SpatialData, monkeypatch) -> None:
+        f = Path(tmp_path) / "data.zarr"
+        shapes.write(f)
+        assert shapes.has_consolidated_metadata()
+        stale_zmetadata = (f / "zmetadata").read_bytes()
+
+        shapes["new_shapes0"] = deepcopy(shapes["circles"])
+        shapes["new_shapes1"] = deepcopy(shapes["poly"])
+        shapes["new_shapes2"] = deepcopy(shapes["poly"])
+        calls = []
+        write_consolidated_metadata = shapes.write_consolidated_metadata
+        monkeypatch.setattr(shapes, "write_consolidated_metadata", lambda: calls.append(write_consolidated_metadata()))
+        shapes.write_element("new_shapes0")
+        assert len(calls) == 1
+        shapes.write_element(["new_shapes1", "new_shapes2"])
+        assert len(calls) == 2
+
+        sdata = read_zarr(f)
+        assert {"new_shapes0", "new_shapes1", "new_shapes2"}.issubset(sdata.shapes)
+
+        # local stores are listed, so consolidated metadata not listing the new elements does not hide them
+        (f / "zmetadata").write_bytes(stale_zmetadata)
+        sdata = read_zarr(f)
+        assert {"new_shapes0", "new_shapes1", "new_shapes2"}.issubset(sdata.shapes)
+
     @pytest.mark.parametrize("dask_backed", [True, False])
     @pytest.mark.parametrize("workaround", [1, 2])
     def test_incremental_io_on_disk(
@@ -675,3 +705,64 @@ def test_element_already_on_disk_different_type(full_sdata, element_name: str) -
             match=ERROR_MSG,
         ):
             full_sdata.write_transformations(element_name)
+
+
+def test_points_parquet_num_rows(tmp_path: str, points: SpatialData) -> None:
+    from spatialdata._io.io_points import _get_points_parquet_num_rows
+
+    f = Path(tmp_path) / "data.zarr"
+    points.write(f)
+    for name, df in points.points.items():
+        num_rows = _get_points_parquet_num_rows(str(f / "points" / name / "points.parquet"))
+        assert isinstance(num_rows, int)
+        assert num_rows == len(df)
+
+
+@pytest.mark.parametrize(
+    "path, precache",
+    [
+        ("data.zarr/points/points_0/points.parquet", False),
+        ("s3://bucket/data.zarr/points/points_0/points.parquet", True),
+        ("simplecache::https://example.com/data.zarr/points/points_0/points.parquet", False),
+    ],
+)
+def test_read_points_parquet_kwargs(monkeypatch, path: str, precache: bool) -> None:
+    import spatialdata._io.io_points
+
+    calls = []
+    monkeypatch.setattr(spatialdata._io.io_points, "read_parquet", lambda *args, **kwargs: calls.append(kwargs))
+    spatialdata._io.io_points._read_points_parquet(path)
+    assert len(calls) == 1
+    assert calls[0]["engine"] == "pyarrow"
+    assert calls[0]["split_row_groups"] == "adaptive"
+    assert ("open_file_options" in calls[0]) == precache
+    if precache:
+        assert calls[0]["open_file_options"] == {"precache_options": {"method": "parquet"}}
+
+    # explicitly passed arguments are respected
+    spatialdata._io.io_points._read_points_parquet(path, split_row_groups=False, open_file_options={})
+    assert calls[1]["split_row_groups"] is False
+    assert calls[1]["open_file_options"] == {}
+
+
+@pytest.mark.parametrize("remote", [True, False])
+def test_write_error_in_worker(tmp_path: str, monkeypatch, remote: bool) -> None:
+    sdata = SpatialData(shapes=_get_shapes(), points=_get_points(), labels=_get_labels())
+    f = UPath(f"memory://{Path(tmp_path).name}/data.zarr") if remote else UPath(Path(tmp_path) / "data.zarr")
+
+    threads = []
+
+    def failing_write_shapes(*args: Any) -> None:
+        threads.append(threading.current_thread())
+        raise RuntimeError("failed to write the shapes")
+
+    monkeypatch.setitem(_get_element_writers(), "shapes", failing_write_shapes)
+    with pytest.raises(RuntimeError, match="failed to write the shapes"):
+        sdata.write(f)
+
+    # the elements are written in parallel only for remote stores
+    assert all((thread is threading.main_thread()) is not remote for thread in threads)
+    # the labels are written after the other elements, so the labels group does not list partially written labels
+    root = zarr.open_group(_open_zarr_store(f), mode="r")
+    assert "labels" not in root["labels"].attrs
+    assert len(root["labels"]) == 0